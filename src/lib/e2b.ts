@@ -10,14 +10,30 @@ const CTA_MARKER = "# __EDUVIDS_CTA_INJECTED__";
 const SCENE_FADE_MARKER = "# __EDUVIDS_SCENE_FADE_OUT__";
 
 const SCALED_TEXT_MARKER = "# __EDUVIDS_SCALED_TEXT__";
+const RANDOM_SEED_MARKER = "# __EDUVIDS_RANDOM_SEED__";
+
+// Dry-run and final render run in separate processes; seeding both gives
+// construct-time random calls the same values in each run. Calls made from
+// updaters or per-frame code can still diverge, since `-s` skips frames.
+const RANDOM_SEED_HELPER = `${RANDOM_SEED_MARKER}
+import random as _random
+import numpy as _np
+
+_EDUVIDS_RANDOM_SEED = 0
+_random.seed(_EDUVIDS_RANDOM_SEED)
+_np.random.seed(_EDUVIDS_RANDOM_SEED)
+`;
 
 const SCALED_TEXT_HELPER = `${SCALED_TEXT_MARKER}
+import functools as _functools
+
 _TEXT_SCALE_FACTOR = 0.3
 _TEXT_SCALE_THRESHOLD = 32
+_TEXT_CACHE_SIZE = 128
 
 _OrigText = Text
 
-def Text(*args, **kwargs):
+def _build_scaled_text(*args, **kwargs):
     scale_font = False
     if "font_size" in kwargs and kwargs["font_size"] < _TEXT_SCALE_THRESHOLD:
         scale_font = True
@@ -26,10 +42,30 @@ def Text(*args, **kwargs):
     if scale_font:
         obj.scale(_TEXT_SCALE_FACTOR)
     return obj
+
+@_functools.lru_cache(maxsize=_TEXT_CACHE_SIZE)
+def _cached_scaled_text(args, kwargs_items):
+    return _build_scaled_text(*args, **dict(kwargs_items))
+
+def Text(*args, **kwargs):
+    # Identical labels are shaped once and handed out as copies, so callers
+    # can still mutate the result freely.
+    key = (args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return _build_scaled_text(*args, **kwargs)
+    return _cached_scaled_text(*key).copy()
 `;
 
-function injectScaledTextHelper(script: string): string {
-  if (script.includes(SCALED_TEXT_MARKER)) return script;
+function injectScriptHelpers(script: string): string {
+  const helpers = [
+    { marker: RANDOM_SEED_MARKER, helper: RANDOM_SEED_HELPER },
+    { marker: SCALED_TEXT_MARKER, helper: SCALED_TEXT_HELPER },
+  ]
+    .filter(({ marker }) => !script.includes(marker))
+    .map(({ helper }) => helper);
+  if (!helpers.length) return script;
 
   // Insert after the last top-level import line
   const lines = script.split("\n");
@@ -48,7 +84,7 @@ function injectScaledTextHelper(script: string): string {
   }
 
   const insertAt = lastImportIndex + 1;
-  lines.splice(insertAt, 0, "", SCALED_TEXT_HELPER);
+  lines.splice(insertAt, 0, ...helpers.flatMap((helper) => ["", helper]));
   return lines.join("\n");
 }
 
@@ -893,7 +929,7 @@ export async function startManimRender({
     const baseVideosDir = `${mediaDir}/videos`;
 
     let enhancedScript = heuristicFixedScript;
-    enhancedScript = injectScaledTextHelper(enhancedScript);
+    enhancedScript = injectScriptHelpers(enhancedScript);
     enhancedScript = injectSceneFadeOut(enhancedScript);
     enhancedScript = injectEduvidsCallout(enhancedScript);
 
@@ -991,12 +1027,15 @@ export async function startManimRender({
     }
 
     // Dry-run validation: render last frame only (`-s`) to catch errors
-    // before committing to the full render. If scriptFixer is provided,
-    // try to patch the script based on Manim output.
+    // before committing to the full render. The snapshot is only used for
+    // error detection and then discarded, so rasterise it at low quality
+    // (`-ql`). If scriptFixer is provided, try to patch the script based on
+    // Manim output.
     const dryRunArgs = [
       scriptPath,
       ...currentSceneNames,
       "-s",
+      "-ql",
       "--disable_caching",
     ];
     const dryRunCmd = `manim ${dryRunArgs.join(" ")}`;
@@ -1480,7 +1519,7 @@ export async function prepareManimSandbox({
     const baseVideosDir = `${mediaDir}/videos`;
 
     let enhancedScript = heuristicFixedScript;
-    enhancedScript = injectScaledTextHelper(enhancedScript);
+    enhancedScript = injectScriptHelpers(enhancedScript);
     enhancedScript = injectSceneFadeOut(enhancedScript);
     enhancedScript = injectEduvidsCallout(enhancedScript);
 
@@ -1556,6 +1595,7 @@ export async function prepareManimSandbox({
       scriptPath,
       ...currentSceneNames,
       "-s",
+      "-ql",
       "--disable_caching",
     ];
     const dryRunCmd = `manim ${dryRunArgs.join(" ")}`;
@@ -2263,9 +2303,15 @@ export async function finalizeManimRender({
       return locatedPath || undefined;
     };
 
+    // Scenes are independent, so probe the sandbox for all of them at once
+    // instead of paying each scene's round-trips in sequence.
+    const locatedScenePaths = await Promise.all(
+      state.sceneNames.map((sceneName) => locateRenderedScenePath(sceneName)),
+    );
     const renderedScenePaths: string[] = [];
-    for (const sceneName of state.sceneNames) {
-      const scenePath = await locateRenderedScenePath(sceneName);
+    for (let i = 0; i < state.sceneNames.length; i++) {
+      const sceneName = state.sceneNames[i];
+      const scenePath = locatedScenePaths[i];
       if (!scenePath) {
         await ensureCleanup();
         throw new ManimValidationError(